@@ -6,16 +6,122 @@ Sends random SOAP messages with UUID generation and custom variables
 
 import os
 import re
+import sys
 import uuid
 import random
 import logging
-import requests
 import argparse
+import threading
+import unicodedata
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 import time
 
+# HTTP client libraries (requests, aiohttp, uvloop) and asyncio are imported where
+# they are used: they dominate startup time and are not needed for --help or errors
+
+# Placeholder syntax used in SOAP templates: {{VARIABLE_NAME}}
+VARIABLE_PATTERN = re.compile(rb'\{\{([A-Z_]+)\}\}')
+
+# Minimum number of keep-alive connections kept open to the endpoint
+MIN_POOL_SIZE = 32
+
+# Content type of a single SOAP 1.1 message
+SOAP_CONTENT_TYPE = 'text/xml; charset=utf-8'
+
+# Read size used to discard response bodies without buffering them
+DRAIN_CHUNK_SIZE = 64 * 1024
+
+
+def _make_translation(alphabet: bytes) -> Tuple[bytes, bytes]:
+    """
+    Build a bytes.translate() table mapping random bytes onto an alphabet
+    
+    Returns:
+        Tuple of (translation table, bytes to discard to avoid modulo bias)
+    """
+    usable = 256 - 256 % len(alphabet)
+    table = bytes(alphabet[b % len(alphabet)] for b in range(256))
+    return table, bytes(range(usable, 256))
+
+
+ALPHA_TRANSLATION = _make_translation(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+ALPHANUM_TRANSLATION = _make_translation(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
+
+
+def _random_string(translation: Tuple[bytes, bytes], length: int) -> str:
+    """Generate a random string from one of the *_TRANSLATION alphabets"""
+    table, discard = translation
+    result = b''
+    while len(result) < length:
+        result += os.urandom(length * 2).translate(table, discard)
+    return result[:length].decode('ascii')
+
+
+def _display_width(text: str) -> int:
+    """Number of terminal columns used by text (emojis and CJK take two)"""
+    width = 0
+    last_width = 0
+    for char in text:
+        if char == '\ufe0f':
+            # Emoji presentation selector widens the preceding symbol (e.g. ⚠️)
+            if last_width == 1:
+                width += 1
+            last_width = 2
+        elif unicodedata.category(char) in ('Mn', 'Me', 'Cf'):
+            continue  # Combining marks take no column
+        else:
+            last_width = 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+            width += last_width
+    return width
+
+
+def setup_logging(level: int = logging.INFO):
+    """Configure the logging system, unless the application already did"""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=level,
+            format='%(asctime)s [%(levelname)s] %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+
+
+class RateLimiter:
+    def __init__(self, interval: float):
+        """
+        Space out calls made from several threads
+        
+        Args:
+            interval: Minimum delay between two calls (seconds)
+        """
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def wait(self) -> float:
+        """
+        Block until the next send slot is available
+        
+        Returns:
+            Time spent waiting (seconds)
+        """
+        if self.interval <= 0:
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+            return wait_time
+        return 0.0
+
+
 class SOAPInjector:
     def __init__(self, soap_dir: str, endpoint: str, timeout: int = 30):
         """
@@ -30,7 +136,12 @@ class SOAPInjector:
         self.endpoint = endpoint
         self.timeout = timeout
         self.soap_files = []
+        self._templates: List[Tuple[str, Callable[[Dict[str, str]], bytes]]] = []
+        self._time_cache: Tuple[int, Dict[str, str]] = (-1, {})
+        import requests
         self.session = requests.Session()
+        self._pool_size = 0
+        self._mount_http_adapter(MIN_POOL_SIZE)
         
         # Configure logging
         self._setup_logging()
@@ -40,11 +151,7 @@ class SOAPInjector:
     
     def _setup_logging(self):
         """Configure the logging system"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s [%(levelname)s] %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        setup_logging()
         self.logger = logging.getLogger(__name__)
     
     def _load_soap_files(self):
@@ -58,172 +165,542 @@ class SOAPInjector:
         if not self.soap_files:
             raise ValueError(f"📄 No XML files found in: {self.soap_dir}")
         
-        self.logger.info(f"📚 Loaded {len(self.soap_files)} SOAP file(s) from {self.soap_dir}")
+        # Read and compile every template once, injections only render them
+        known_names = set(self._generate_variables())
+        self._templates = [
+            (soap_file.name, self._compile_template(
+                soap_file.name, self._tokenize_template(self._load_soap_content(soap_file)), known_names))
+            for soap_file in self.soap_files
+        ]
+        
+        self.logger.info("📚 Loaded %d SOAP file(s) from %s", len(self.soap_files), self.soap_dir)
         for file in self.soap_files:
-            self.logger.info(f"   📄 {file.name}")
+            self.logger.info("   📄 %s", file.name)
     
-    def _generate_variables(self) -> Dict[str, str]:
+    def _generate_static_variables(self) -> Dict[str, str]:
         """
-        Generate replacement variables
+        Generate the time-based variables, which can be shared by a batch
         
         Returns:
             Dictionary of variables with their values
         """
-        now = datetime.now()
+        now = time.time()
+        second = int(now)
+        
+        # Everything but TIMESTAMP_MS only changes once per second: render it
+        # once and share it with every message sent within the same second
+        cached_second, cached = self._time_cache
+        if second != cached_second:
+            iso = datetime.fromtimestamp(second).isoformat()
+            cached = {
+                'TIMESTAMP': iso,
+                'DATE': iso[:10],
+                'TIME': iso[11:19],
+                'EPOCH': str(second),
+            }
+            self._time_cache = (second, cached)
+        
+        return dict(cached, TIMESTAMP_MS=f"{cached['TIMESTAMP']}.{int((now - second) * 1000):03d}")
+    
+    def _generate_dynamic_variables(self, static: Dict[str, str]) -> Dict[str, str]:
+        """
+        Generate the variables that must be unique for every message
+        
+        Args:
+            static: Variables returned by _generate_static_variables
+            
+        Returns:
+            Dictionary of all variables with their values
+        """
+        # One UUID, sliced into every format
+        uuid_hex = uuid.uuid4().hex
+        uuid_str = f"{uuid_hex[:8]}-{uuid_hex[8:12]}-{uuid_hex[12:16]}-{uuid_hex[16:20]}-{uuid_hex[20:]}"
         
         variables = {
             # UUID
-            'UUID': str(uuid.uuid4()),
-            'UUID_UPPER': str(uuid.uuid4()).upper(),
-            'UUID_NO_DASH': str(uuid.uuid4()).replace('-', ''),
-            
-            # Timestamps
-            'TIMESTAMP': now.strftime('%Y-%m-%dT%H:%M:%S'),
-            'TIMESTAMP_MS': now.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3],
-            'DATE': now.strftime('%Y-%m-%d'),
-            'TIME': now.strftime('%H:%M:%S'),
-            'EPOCH': str(int(now.timestamp())),
+            'UUID': uuid_str,
+            'UUID_UPPER': uuid_str.upper(),
+            'UUID_NO_DASH': uuid_hex,
             
             # Random identifiers
             'RANDOM_ID': str(random.randint(100000, 999999)),
-            'RANDOM_ALPHA': ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ', k=8)),
-            'RANDOM_ALPHANUM': ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789', k=10)),
+            'RANDOM_ALPHA': _random_string(ALPHA_TRANSLATION, 8),
+            'RANDOM_ALPHANUM': _random_string(ALPHANUM_TRANSLATION, 10),
         }
+        variables.update(static)
         
         return variables
     
-    def _replace_variables(self, content: str, variables: Dict[str, str]) -> str:
+    def _generate_variables(self) -> Dict[str, str]:
+        """
+        Generate replacement variables
+        
+        Returns:
+            Dictionary of variables with their values
+        """
+        return self._generate_dynamic_variables(self._generate_static_variables())
+    
+    def _tokenize_template(self, content: bytes) -> List[Union[bytes, str]]:
         """
-        Replace variables in SOAP content
+        Split SOAP content around its variables
         
         Supported format: {{VARIABLE_NAME}}
         
         Args:
-            content: Original SOAP content
-            variables: Variables to replace
+            content: Original SOAP content, UTF-8 encoded
+            
+        Returns:
+            Alternating literal byte chunks (even indexes) and variable names (odd indexes)
+        """
+        parts = VARIABLE_PATTERN.split(content)
+        parts[1::2] = [name.decode('ascii') for name in parts[1::2]]
+        return parts
+    
+    def _compile_template(self, soap_name: str, parts: List[Union[bytes, str]],
+                          known_names: Set[str]) -> Callable[[Dict[str, str]], bytes]:
+        """
+        Generate a dedicated render function for a tokenized SOAP template
+        
+        The function is built as Python source and compiled once, so rendering
+        a message is a single b''.join() over constants and variable lookups.
+        
+        Args:
+            soap_name: SOAP file name, used to label the generated code
+            parts: Template tokens as returned by _tokenize_template
+            known_names: Variable names that _generate_variables provides
             
         Returns:
-            Content with replaced variables
+            Function mapping the variables to the UTF-8 encoded content
         """
-        result = content
+        pieces = []
+        literal = b''
+        for i, part in enumerate(parts):
+            if i % 2 == 0:
+                literal += part
+            elif part in known_names:
+                if literal:
+                    pieces.append(repr(literal))
+                    literal = b''
+                pieces.append(f"v[{part!r}].encode('utf-8')")
+            else:
+                # Unknown placeholders are left as-is
+                literal += f"{{{{{part}}}}}".encode('utf-8')
+        if literal:
+            pieces.append(repr(literal))
         
-        for var_name, var_value in variables.items():
-            pattern = f"{{{{{var_name}}}}}"
-            result = result.replace(pattern, var_value)
+        source = f"def render(v):\n    return b''.join([{', '.join(pieces)}])\n"
+        namespace = {}
+        exec(compile(source, f"<template {soap_name}>", 'exec'), namespace)
+        return namespace['render']
+    
+    def _mount_http_adapter(self, pool_size: int):
+        """Size the session connection pool for the given number of workers"""
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        pool_size = max(pool_size, MIN_POOL_SIZE)
+        if pool_size <= self._pool_size:
+            return  # Keep the current pool and its open connections
         
-        return result
+        # A single endpoint host is targeted, so one pool of reusable
+        # keep-alive connections is enough
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.1),
+        )
+        previous = {self.session.adapters[prefix] for prefix in ('http://', 'https://')
+                    if prefix in self.session.adapters}
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._pool_size = pool_size
+        
+        # Release the sockets kept alive by the pool being replaced
+        for old_adapter in previous:
+            old_adapter.close()
+    
+    def _select_random_soap(self) -> int:
+        """Select a random SOAP template index"""
+        return random.randrange(len(self._templates))
     
-    def _select_random_soap(self) -> Path:
-        """Select a random SOAP file"""
-        return random.choice(self.soap_files)
+    def _select_random_soaps(self, count: int) -> List[int]:
+        """Select random SOAP template indexes for a whole batch in one call"""
+        return random.choices(range(len(self._templates)), k=count)
     
-    def _load_soap_content(self, soap_file: Path) -> str:
-        """Load the content of a SOAP file"""
+    def _load_soap_content(self, soap_file: Path) -> bytes:
+        """Load the UTF-8 content of a SOAP file, with newlines normalized to LF"""
         try:
-            with open(soap_file, 'r', encoding='utf-8') as f:
-                return f.read()
+            # Same line endings as a text-mode read: CRLF and lone CR become LF
+            return soap_file.read_bytes().replace(b'\r\n', b'\n').replace(b'\r', b'\n')
         except Exception as e:
-            self.logger.error(f"❌ Error reading {soap_file.name}: {e}")
+            self.logger.error("❌ Error reading %s: %s", soap_file.name, e)
             raise
     
-    def _send_soap_request(self, content: str, soap_file: str) -> bool:
+    def _send_soap_request(self, content: bytes, soap_file: str,
+                           content_type: str = SOAP_CONTENT_TYPE) -> bool:
         """
         Send a SOAP request
         
         Args:
-            content: SOAP content to send
+            content: UTF-8 encoded SOAP content to send
             soap_file: SOAP file name for logging
+            content_type: Content-Type header, multipart for batches
             
         Returns:
             True if success (HTTP 200), False otherwise
         """
+        import requests
+        
         headers = {
-            'Content-Type': 'text/xml; charset=utf-8',
+            'Content-Type': content_type,
             'SOAPAction': '""',  # Empty SOAPAction by default
         }
         
         try:
             response = self.session.post(
                 self.endpoint,
-                data=content.encode('utf-8'),
+                data=content,
                 headers=headers,
-                timeout=self.timeout
+                timeout=self.timeout,
+                stream=True
             )
             
-            # HTTP status verification
-            if response.status_code == 200:
-                self.logger.info(f"✅ [{soap_file}] → {self.endpoint} | HTTP {response.status_code} | {len(response.content)} bytes")
-                return True
-            else:
-                self.logger.warning(f"⚠️ [{soap_file}] → {self.endpoint} | HTTP {response.status_code} | {response.reason}")
-                self.logger.debug(f"Response: {response.text[:200]}...")
-                return False
+            with response:
+                # HTTP status verification
+                if response.status_code == 200:
+                    # Discard the body chunk by chunk: it is never held in memory, and
+                    # a fully read response gives its keep-alive connection back to the pool
+                    size = sum(len(chunk) for chunk in self._iter_response_body(response, DRAIN_CHUNK_SIZE))
+                    self.logger.info("✅ [%s] → %s | HTTP %d | %d bytes",
+                                     soap_file, self.endpoint, response.status_code, size)
+                    return True
+                else:
+                    self.logger.warning("⚠️ [%s] → %s | HTTP %d | %s",
+                                        soap_file, self.endpoint, response.status_code, response.reason)
+                    # Error bodies (e.g. SOAP faults) are drained too, keeping the connection
+                    preview = b''
+                    for chunk in self._iter_response_body(response, DRAIN_CHUNK_SIZE):
+                        if len(preview) < 200:
+                            preview += chunk[:200 - len(preview)]
+                    self.logger.debug("Response: %s...", preview.decode('utf-8', errors='replace'))
+                    return False
                 
         except requests.exceptions.Timeout:
-            self.logger.error(f"⏰ [{soap_file}] → {self.endpoint} | Timeout after {self.timeout}s")
+            self.logger.error("⏰ [%s] → %s | Timeout after %ss", soap_file, self.endpoint, self.timeout)
             return False
         except requests.exceptions.ConnectionError:
-            self.logger.error(f"🔌 [{soap_file}] → {self.endpoint} | Connection failed - endpoint unreachable")
+            self.logger.error("🔌 [%s] → %s | Connection failed - endpoint unreachable", soap_file, self.endpoint)
             return False
         except Exception as e:
-            self.logger.error(f"💥 [{soap_file}] → {self.endpoint} | Unexpected error: {type(e).__name__}: {e}")
+            self.logger.error("💥 [%s] → %s | Unexpected error: %s: %s", soap_file, self.endpoint, type(e).__name__, e)
             return False
     
-    def inject_single(self) -> bool:
+    def _iter_response_body(self, response, chunk_size: int) -> Iterator[bytes]:
         """
-        Inject a single SOAP message
+        Iterate over a streamed response body
         
+        requests reports a read timeout hit while streaming as a ConnectionError,
+        it is raised as a Timeout again so a stalled body is not logged as an
+        unreachable endpoint.
+        
+        Args:
+            response: requests.Response sent with stream=True
+            chunk_size: Maximum size of each chunk
+            
         Returns:
-            True if success, False otherwise
+            Iterator over the body chunks
         """
-        # Random selection of a SOAP file
-        soap_file = self._select_random_soap()
+        import requests
+        from urllib3.exceptions import ReadTimeoutError
         
-        # Load content
-        content = self._load_soap_content(soap_file)
+        try:
+            yield from response.iter_content(chunk_size)
+        except requests.exceptions.ConnectionError as e:
+            if e.args and isinstance(e.args[0], ReadTimeoutError):
+                raise requests.exceptions.ReadTimeout(e.args[0], response=response) from e
+            raise
+    
+    async def _send_soap_request_async(self, session, content: bytes, soap_file: str,
+                                       content_type: str = SOAP_CONTENT_TYPE) -> bool:
+        """
+        Send a SOAP request through an aiohttp session
+        
+        Args:
+            session: aiohttp.ClientSession shared by the batch
+            content: UTF-8 encoded SOAP content to send
+            soap_file: SOAP file name for logging
+            content_type: Content-Type header, multipart for batches
+            
+        Returns:
+            True if success (HTTP 200), False otherwise
+        """
+        import asyncio
+        import aiohttp
+        
+        headers = {
+            'Content-Type': content_type,
+            'SOAPAction': '""',  # Empty SOAPAction by default
+        }
+        
+        try:
+            async with session.post(
+                self.endpoint,
+                data=content,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                # HTTP status verification
+                if response.status == 200:
+                    # Discard the body chunk by chunk so the connection can be reused
+                    size = 0
+                    async for chunk in response.content.iter_chunked(DRAIN_CHUNK_SIZE):
+                        size += len(chunk)
+                    self.logger.info("✅ [%s] → %s | HTTP %d | %d bytes",
+                                     soap_file, self.endpoint, response.status, size)
+                    return True
+                else:
+                    self.logger.warning("⚠️ [%s] → %s | HTTP %d | %s",
+                                        soap_file, self.endpoint, response.status, response.reason)
+                    # Error bodies (e.g. SOAP faults) are drained too, keeping the connection
+                    preview = b''
+                    async for chunk in response.content.iter_chunked(DRAIN_CHUNK_SIZE):
+                        if len(preview) < 200:
+                            preview += chunk[:200 - len(preview)]
+                    self.logger.debug("Response: %s...", preview.decode('utf-8', errors='replace'))
+                    return False
+                
+        except asyncio.TimeoutError:
+            self.logger.error("⏰ [%s] → %s | Timeout after %ss", soap_file, self.endpoint, self.timeout)
+            return False
+        except aiohttp.ClientConnectionError:
+            self.logger.error("🔌 [%s] → %s | Connection failed - endpoint unreachable", soap_file, self.endpoint)
+            return False
+        except Exception as e:
+            self.logger.error("💥 [%s] → %s | Unexpected error: %s: %s", soap_file, self.endpoint, type(e).__name__, e)
+            return False
+    
+    def _build_message(self, static: Optional[Dict[str, str]] = None,
+                       template_index: Optional[int] = None) -> Tuple[str, bytes]:
+        """
+        Pick a random SOAP file and render it with fresh variables
+        
+        Args:
+            static: Batch-wide time variables, generated per message if omitted
+            template_index: Preselected SOAP template, picked at random if omitted
+            
+        Returns:
+            Tuple of (SOAP file name, UTF-8 encoded processed content)
+        """
+        # Random selection of a preloaded SOAP template
+        if template_index is None:
+            template_index = self._select_random_soap()
+        soap_name, render = self._templates[template_index]
         
         # Generate variables
-        variables = self._generate_variables()
+        if static is None:
+            static = self._generate_static_variables()
+        variables = self._generate_dynamic_variables(static)
         
         # Replace variables
-        processed_content = self._replace_variables(content, variables)
+        processed_content = render(variables)
         
         # Log generated variables (debug)
-        self.logger.debug(f"Generated variables: {list(variables.keys())}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Generated variables: %s", list(variables))
+        
+        return soap_name, processed_content
+    
+    def _build_batch(self, static: Optional[Dict[str, str]],
+                     template_indexes: List[int]) -> Tuple[str, bytes, str]:
+        """
+        Render several SOAP messages into one HTTP payload
+        
+        A single message is sent as-is, several are wrapped as the parts of
+        a multipart/related body so one POST carries the whole group.
+        
+        Args:
+            static: Batch-wide time variables, generated per message if omitted
+            template_indexes: Preselected SOAP templates, one per message
+            
+        Returns:
+            Tuple of (label for logging, UTF-8 encoded payload, content type)
+        """
+        if len(template_indexes) == 1:
+            soap_name, processed_content = self._build_message(static, template_indexes[0])
+            return soap_name, processed_content, SOAP_CONTENT_TYPE
+        
+        boundary = f"soap-batch-{uuid.uuid4().hex}"
+        delimiter = f"--{boundary}\r\n".encode('ascii')
+        payload = []
+        for part, template_index in enumerate(template_indexes, 1):
+            _, processed_content = self._build_message(static, template_index)
+            payload += [
+                delimiter,
+                f"Content-Type: {SOAP_CONTENT_TYPE}\r\nContent-ID: <part-{part}>\r\n\r\n".encode('ascii'),
+                processed_content,
+                b"\r\n",
+            ]
+        payload.append(f"--{boundary}--\r\n".encode('ascii'))
+        
+        content_type = f'multipart/related; type="text/xml"; start="<part-1>"; boundary="{boundary}"'
+        return f"batch of {len(template_indexes)}", b''.join(payload), content_type
+    
+    def _split_batches(self, count: int, batch_size: int) -> List[List[int]]:
+        """Draw random template indexes for count messages, grouped per HTTP request"""
+        template_indexes = self._select_random_soaps(count)
+        return [template_indexes[i:i + batch_size] for i in range(0, count, batch_size)]
+    
+    def inject_single(self, static: Optional[Dict[str, str]] = None,
+                      template_index: Optional[int] = None) -> bool:
+        """
+        Inject a single SOAP message
+        
+        Args:
+            static: Batch-wide time variables, generated per message if omitted
+            template_index: Preselected SOAP template, picked at random if omitted
+            
+        Returns:
+            True if success, False otherwise
+        """
+        soap_name, processed_content = self._build_message(static, template_index)
         
         # Send request
-        return self._send_soap_request(processed_content, soap_file.name)
+        return self._send_soap_request(processed_content, soap_name)
     
-    def inject_multiple(self, count: int, delay: float = 0.0) -> Dict[str, int]:
+    def inject_multiple(self, count: int, delay: float = 0.0, concurrency: int = 10,
+                        freeze_time: bool = False, batch_size: int = 1) -> Dict[str, int]:
         """
-        Inject multiple SOAP messages
+        Inject multiple SOAP messages from a pool of threads
         
         Args:
             count: Number of messages to send
-            delay: Delay between each send (seconds)
+            delay: Delay between each HTTP request start (seconds)
+            concurrency: Maximum number of in-flight requests
+            freeze_time: Reuse the batch start time for every message
+            batch_size: Number of messages sent per HTTP request
             
         Returns:
             Send statistics
         """
+        if concurrency < 1:
+            raise ValueError(f"⚙️ Concurrency must be at least 1, got {concurrency}")
+        if batch_size < 1:
+            raise ValueError(f"⚙️ Batch size must be at least 1, got {batch_size}")
+        
         stats = {'success': 0, 'failed': 0, 'total': count}
         
-        self.logger.info(f"🚀 Starting injection of {count} SOAP message(s)")
+        self.logger.info("🚀 Starting injection of %d SOAP message(s) (%d concurrent)", count, concurrency)
         start_time = time.time()
+        static = self._generate_static_variables() if freeze_time else None
+        
+        self._mount_http_adapter(concurrency)
+        rate_limiter = RateLimiter(delay)
         
-        for i in range(1, count + 1):
-            success = self.inject_single()
+        def send(template_indexes):
+            waited = rate_limiter.wait()
+            if waited > 0:
+                self.logger.info("⏳ Waited %.2fs before next send", waited)
+            label, payload, content_type = self._build_batch(static, template_indexes)
+            return self._send_soap_request(payload, label, content_type)
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(send, template_indexes): len(template_indexes)
+                for template_indexes in self._split_batches(count, batch_size)
+            }
             
-            if success:
-                stats['success'] += 1
-            else:
-                stats['failed'] += 1
+            for future in as_completed(futures):
+                try:
+                    success = future.result()
+                except Exception as e:
+                    self.logger.error("💥 Injection failed: %s: %s", type(e).__name__, e)
+                    success = False
+                
+                if success:
+                    stats['success'] += futures[future]
+                else:
+                    stats['failed'] += futures[future]
+        
+        self._log_summary(stats, time.time() - start_time)
+        
+        return stats
+    
+    async def inject_multiple_async(self, count: int, delay: float = 0.0, concurrency: int = 10,
+                                    freeze_time: bool = False, batch_size: int = 1) -> Dict[str, int]:
+        """
+        Inject multiple SOAP messages concurrently (requires aiohttp)
+        
+        Args:
+            count: Number of messages to send
+            delay: Delay between each HTTP request start (seconds)
+            concurrency: Maximum number of in-flight requests
+            freeze_time: Reuse the batch start time for every message
+            batch_size: Number of messages sent per HTTP request
             
-            # Delay between sends
-            if delay > 0 and i < count:
-                self.logger.info(f"⏳ Waiting {delay}s before next send...")
-                time.sleep(delay)
+        Returns:
+            Send statistics
+        """
+        import asyncio
+        import aiohttp
+        
+        if concurrency < 1:
+            raise ValueError(f"⚙️ Concurrency must be at least 1, got {concurrency}")
+        if batch_size < 1:
+            raise ValueError(f"⚙️ Batch size must be at least 1, got {batch_size}")
+        
+        stats = {'success': 0, 'failed': 0, 'total': count}
+        
+        self.logger.info("🚀 Starting injection of %d SOAP message(s) (%d concurrent)", count, concurrency)
+        start_time = time.time()
+        static = self._generate_static_variables() if freeze_time else None
+        
+        # Bounded queue: the producer never runs far ahead of the workers
+        queue = asyncio.Queue(maxsize=concurrency * 2)
+        
+        async def worker(session):
+            while True:
+                template_indexes = await queue.get()
+                try:
+                    label, payload, content_type = self._build_batch(static, template_indexes)
+                    success = await self._send_soap_request_async(session, payload, label, content_type)
+                except Exception as e:
+                    self.logger.error("💥 Injection failed: %s: %s", type(e).__name__, e)
+                    success = False
+                
+                if success:
+                    stats['success'] += len(template_indexes)
+                else:
+                    stats['failed'] += len(template_indexes)
+                queue.task_done()
+        
+        connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            workers = [asyncio.create_task(worker(session)) for _ in range(concurrency)]
+            
+            batches = self._split_batches(count, batch_size)
+            for i, template_indexes in enumerate(batches, 1):
+                await queue.put(template_indexes)
+                
+                # Delay between send starts
+                if delay > 0 and i < len(batches):
+                    self.logger.info("⏳ Waiting %ss before next send...", delay)
+                    await asyncio.sleep(delay)
+            
+            await queue.join()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        
+        self._log_summary(stats, time.time() - start_time)
+        
+        return stats
+    
+    def _log_summary(self, stats: Dict[str, int], elapsed: float):
+        """Log the statistics box of a batch run"""
+        # The box lines are padded eagerly, skip them when INFO is filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         
-        elapsed = time.time() - start_time
         success_rate = (stats['success'] / stats['total']) * 100
         
         # Create a nice statistics box
@@ -231,24 +708,41 @@ class SOAPInjector:
         
         def format_box_line(text):
             """Format a line to fit perfectly in the box"""
-            # Calculate actual display width accounting for emojis
-            visual_length = len(text)
-            # Each emoji takes 2 display positions but counts as 1 in string length
-            emoji_count = sum(1 for char in text if ord(char) > 127)
-            visual_length += emoji_count
-            
-            padding_needed = box_width - 3 - visual_length  # 3 for "│ " and "│"
+            padding_needed = box_width - 3 - _display_width(text)  # 3 for "│ " and "│"
             return f"│ {text}{' ' * padding_needed}│"
         
-        self.logger.info("┌" + "─" * (box_width - 2) + "┐")
+        self.logger.info("┌%s┐", "─" * (box_width - 2))
         self.logger.info(format_box_line("📊 INJECTION SUMMARY"))
-        self.logger.info("├" + "─" * (box_width - 2) + "┤")
+        self.logger.info("├%s┤", "─" * (box_width - 2))
         self.logger.info(format_box_line(f"🏁 Completed in: {elapsed:.2f}s"))
         self.logger.info(format_box_line(f"✅ Success: {stats['success']}/{stats['total']} ({success_rate:.1f}%)"))
         self.logger.info(format_box_line(f"❌ Failed: {stats['failed']}/{stats['total']}"))
-        self.logger.info("└" + "─" * (box_width - 2) + "┘")
-        
-        return stats
+        self.logger.info("└%s┘", "─" * (box_width - 2))
+
+
+def _event_loop_runner() -> Callable:
+    """Return the function running the async injector, on uvloop when available"""
+    import asyncio
+    
+    try:
+        import uvloop
+    except ImportError:  # Optional dependency, faster event loop
+        return asyncio.run
+    
+    run = getattr(uvloop, 'run', None)
+    if run is None:
+        # uvloop < 0.18 has no run(), install its event loop policy instead
+        uvloop.install()
+        return asyncio.run
+    return run
+
+
+def positive_int(value: str) -> int:
+    """argparse type for options that need a strictly positive integer"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
@@ -262,27 +756,38 @@ def main():
                        help='Delay between sends in seconds (default: 0)')
     parser.add_argument('--timeout', '-t', type=int, default=30,
                        help='HTTP request timeout (default: 30s)')
+    parser.add_argument('--concurrency', '-j', type=positive_int, default=10,
+                       help='Maximum number of concurrent requests (default: 10)')
+    parser.add_argument('--batch-size', '-b', type=positive_int, default=1,
+                       help='Messages sent per HTTP request as a multipart/related batch (default: 1)')
+    parser.add_argument('--freeze-time', action='store_true',
+                       help='Use the batch start time for all timestamp variables')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Verbose mode (debug)')
     
     args = parser.parse_args()
     
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    # Configured before the injector so --verbose is not overridden by its defaults
+    setup_logging(logging.DEBUG if args.verbose else logging.INFO)
     
     try:
         injector = SOAPInjector(args.soap_dir, args.endpoint, args.timeout)
         
         if args.count == 1:
             success = injector.inject_single()
-            exit(0 if success else 1)
+            sys.exit(0 if success else 1)
+        elif importlib.util.find_spec('aiohttp') is not None:
+            stats = _event_loop_runner()(injector.inject_multiple_async(
+                args.count, args.delay, args.concurrency, args.freeze_time, args.batch_size))
+            sys.exit(0 if stats['failed'] == 0 else 1)
         else:
-            stats = injector.inject_multiple(args.count, args.delay)
-            exit(0 if stats['failed'] == 0 else 1)
+            stats = injector.inject_multiple(
+                args.count, args.delay, args.concurrency, args.freeze_time, args.batch_size)
+            sys.exit(0 if stats['failed'] == 0 else 1)
             
     except Exception as e:
-        logging.error(f"💀 Fatal error: {e}")
-        exit(1)
+        logging.error("💀 Fatal error: %s", e)
+        sys.exit(1)
 
 
 if __name__ == "__main__":